@@ -1,5 +1,7 @@
 import argparse
 
+from probe import DEFAULT_CONCURRENCY, DEFAULT_TIMEOUT
+
 
 def create_parser():
     """Create and configure the argument parser for the CLI tool."""
@@ -53,6 +55,30 @@ def create_parser():
         help="Skip confirmation prompt when resetting all descriptions",
     )
 
+    # Command: http probe <file>
+    probe_parser = subparsers.add_parser(
+        "probe",
+        help="Check URLs and explain the returned HTTP status codes.",
+        description="Check URLs and explain the returned HTTP status codes.",
+    )
+    probe_parser.add_argument(
+        "file", nargs="?", help="File with one URL per line"
+    )
+    probe_parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Maximum number of requests in flight",
+    )
+    probe_parser.add_argument(
+        "--timeout",
+        "-t",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help="Timeout in seconds for probing each URL, including the GET fallback",
+    )
+
     # Command: http help
     help_parser = subparsers.add_parser(
         "help",
@@ -108,4 +134,9 @@ def parse_arguments(args):
             # If neither --all nor code is specified, show help for reset
             return "help", {"command": "reset"}
 
+    # Special handling for probe command
+    if command == "probe" and not parsed_args.file:
+        # Without a URL file, show help for probe
+        return "help", {"command": "probe"}
+
     return command, command_args
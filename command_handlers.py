@@ -1,5 +1,8 @@
+import asyncio
 import sys
 
+from probe import DEFAULT_CONCURRENCY, DEFAULT_TIMEOUT, probe_urls, read_urls
+
 
 def handle_get(data_manager, code):
     """Handle the 'get' command to display the description for an HTTP status code.
@@ -110,6 +113,52 @@ def handle_reset(data_manager, code=None, all=False, yes=False):
         sys.exit(1)
 
 
+def handle_probe(data_manager, file, concurrency, timeout):
+    """Handle the 'probe' command to check URLs and explain their status codes.
+
+    Args:
+        data_manager: The DataManager instance.
+        file (str): Path to a file with one URL per line.
+        concurrency (int): Maximum number of requests in flight.
+        timeout (float): Timeout in seconds for probing each URL.
+    """
+    if concurrency < 1:
+        print("Error: --concurrency must be at least 1.")
+        sys.exit(1)
+
+    if timeout <= 0:
+        print("Error: --timeout must be greater than 0.")
+        sys.exit(1)
+
+    try:
+        urls = read_urls(file)
+    except OSError as e:
+        print(f"Error: Could not read URL file '{file}': {e}")
+        sys.exit(1)
+
+    if not urls:
+        print(f"No URLs found in '{file}'.")
+        return
+
+    async def run():
+        failed = 0
+        async for url, status, error in probe_urls(urls, concurrency, timeout):
+            if error:
+                failed += 1
+                print(f"ERR {url}: {error}", flush=True)
+                continue
+            description = data_manager.get_description(str(status))
+            print(f"{status} {url}: {description or 'Unknown status code'}", flush=True)
+        return failed
+
+    failed = asyncio.run(run())
+
+    print()
+    print(f"Probed {len(urls)} URLs, {failed} failed.")
+    if failed:
+        sys.exit(1)
+
+
 def handle_help(data_manager, command=None):
     """Handle the 'help' command to display help information.
 
@@ -144,6 +193,31 @@ def handle_help(data_manager, command=None):
         )
         return
 
+    if command == "probe":
+        print("Usage: http probe <file> [--concurrency N] [--timeout SECONDS]")
+        print()
+        print("Check the URLs listed in a file and explain each returned status code.")
+        print("Each URL is requested with HEAD, falling back to GET if HEAD is not")
+        print("supported. Results are printed as soon as they arrive.")
+        print()
+        print("Arguments:")
+        print("  <file>                  File with one URL per line (# starts a comment)")
+        print()
+        print("Options:")
+        print(
+            "  --concurrency, -c N     Maximum number of requests in flight "
+            f"(default: {DEFAULT_CONCURRENCY})"
+        )
+        print(
+            "  --timeout, -t SECONDS   Timeout for probing each URL "
+            f"(default: {DEFAULT_TIMEOUT:g})"
+        )
+        print()
+        print("Examples:")
+        print("  http probe urls.txt")
+        print("  http probe urls.txt --concurrency 20 --timeout 2")
+        return
+
     print("HTTP Status Code CLI Tool")
     print()
     print("Usage:")
@@ -153,6 +227,7 @@ def handle_help(data_manager, command=None):
     print("  http edit <code> <desc>     Edit the description for an HTTP status code")
     print("  http reset <code>           Reset the description for an HTTP status code")
     print("  http reset --all [--yes]    Reset all custom descriptions")
+    print("  http probe <file>           Check URLs and explain their status codes")
     print("  http help                   Display this help message")
     print()
     print("Commands:")
@@ -171,6 +246,10 @@ def handle_help(data_manager, command=None):
     print("                              Example: http reset --all")
     print("                              Example: http reset --all --yes")
     print()
+    print("  probe <file>                Check URLs and explain their status codes")
+    print("                              Example: http probe urls.txt")
+    print("                              Example: http probe urls.txt -c 20 -t 2")
+    print()
     print("  help                        Display this help message")
     print()
     print("Error Handling:")
@@ -4,7 +4,13 @@ import os
 
 from data_manager import DataManager
 from argument_parser import parse_arguments
-from command_handlers import handle_get, handle_edit, handle_reset, handle_help
+from command_handlers import (
+    handle_get,
+    handle_edit,
+    handle_reset,
+    handle_probe,
+    handle_help,
+)
 
 
 def main():
@@ -47,6 +53,13 @@ def main():
                 all=args.get("all", False),
                 yes=args.get("yes", False),
             )
+        elif command == "probe":
+            handle_probe(
+                data_manager,
+                args["file"],
+                concurrency=args["concurrency"],
+                timeout=args["timeout"],
+            )
         elif command == "help":
             handle_help(data_manager, args.get("command"))
         else:
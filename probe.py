@@ -0,0 +1,255 @@
+import asyncio
+import http.client
+import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlsplit
+
+DEFAULT_CONCURRENCY = 10
+DEFAULT_TIMEOUT = 5.0
+
+# Servers answering HEAD with one of these codes are retried with GET.
+HEAD_FALLBACK_STATUSES = {405, 501}
+
+# Characters left as-is when percent-encoding a path or query: "%" for
+# existing escapes plus the RFC 3986 reserved characters.
+URL_SAFE_CHARACTERS = "%/:@!$&'()*+,;="
+
+# Errors that mean a pooled keep-alive connection was closed by the server.
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class ConnectionPool:
+    """Keep idle keep-alive connections per (scheme, host, port) for reuse.
+
+    Connections handed out by acquire() are tracked until they are released
+    or discarded, so close() can abort requests that are still in flight.
+    """
+
+    def __init__(self):
+        self._idle = {}
+        self._in_use = set()
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def acquire(self, key):
+        """Get an idle connection for the given key, or open a new one.
+
+        Args:
+            key (tuple): The (scheme, host, port) of the target server.
+
+        Returns:
+            tuple: A tuple containing (connection, reused).
+        """
+        with self._lock:
+            if self._closed:
+                raise ConnectionAbortedError("probe cancelled")
+
+            idle = self._idle.get(key)
+            if idle:
+                connection, reused = idle.pop(), True
+            else:
+                scheme, host, port = key
+                if scheme == "https":
+                    connection_class = http.client.HTTPSConnection
+                else:
+                    connection_class = http.client.HTTPConnection
+                connection, reused = connection_class(host, port), False
+
+            self._in_use.add(connection)
+            return connection, reused
+
+    def release(self, key, connection):
+        """Return a connection to the pool so later requests can reuse it."""
+        with self._lock:
+            self._in_use.discard(connection)
+            if self._closed:
+                connection.close()
+            else:
+                self._idle.setdefault(key, []).append(connection)
+
+    def discard(self, connection):
+        """Close a connection that cannot be reused."""
+        with self._lock:
+            self._in_use.discard(connection)
+        connection.close()
+
+    def close(self):
+        """Close all idle connections and abort requests still in flight."""
+        with self._lock:
+            self._closed = True
+            for connection in self._in_use:
+                shutdown_socket(connection)
+            for connections in self._idle.values():
+                for connection in connections:
+                    connection.close()
+            self._idle = {}
+
+
+def normalize_url(url):
+    """Add a default http:// scheme to URLs given without one."""
+    if not re.match(r"^[A-Za-z][A-Za-z0-9+.-]*://", url):
+        return "http://" + url
+    return url
+
+
+def read_urls(file_path):
+    """Read URLs from a file, one per line, skipping blank lines and # comments."""
+    urls = []
+    with open(file_path, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                urls.append(line)
+    return urls
+
+
+def shutdown_socket(connection):
+    """Unblock any read or write on a connection's socket."""
+    sock = connection.sock
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+def abort_connection(connection, timed_out):
+    """Mark a request as timed out and unblock any read on its socket."""
+    timed_out.set()
+    shutdown_socket(connection)
+
+
+def request_status(pool, method, url, deadline):
+    """Send a single request through the pool and return the response status.
+
+    Args:
+        pool (ConnectionPool): The pool to take the connection from.
+        method (str): The HTTP method, e.g. "HEAD" or "GET".
+        url (str): The absolute URL to request.
+        deadline (float): The time.monotonic() value by which the request,
+            including any reconnects, must have finished.
+
+    Returns:
+        int: The HTTP status code of the response.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError(f"unsupported URL '{url}'")
+
+    # Always pass an explicit port: http.client would otherwise read the last
+    # ":" group of an unbracketed IPv6 host such as "::1" as the port.
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    key = (parts.scheme, parts.hostname, port)
+    # Percent-encode non-ASCII characters; http.client only sends ASCII.
+    path = quote(parts.path or "/", safe=URL_SAFE_CHARACTERS)
+    if parts.query:
+        path += "?" + quote(parts.query, safe=URL_SAFE_CHARACTERS + "?")
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise socket.timeout("timed out")
+
+        connection, reused = pool.acquire(key)
+        connection.timeout = remaining
+        if connection.sock is not None:
+            connection.sock.settimeout(remaining)
+
+        # The socket timeout only bounds each read, so a server trickling its
+        # response could run past the deadline; the watchdog cuts it off.
+        timed_out = threading.Event()
+        watchdog = threading.Timer(
+            remaining, abort_connection, (connection, timed_out)
+        )
+        watchdog.start()
+        try:
+            connection.request(method, path, headers={"User-Agent": "http-cli"})
+            response = connection.getresponse()
+            # Drain the body so the connection can be reused.
+            response.read()
+        except Exception as e:
+            pool.discard(connection)
+            if timed_out.is_set():
+                raise socket.timeout("timed out")
+            if reused and isinstance(e, STALE_CONNECTION_ERRORS):
+                # The server dropped an idle connection; retry on a fresh one.
+                continue
+            raise
+        finally:
+            watchdog.cancel()
+
+        if timed_out.is_set() or response.will_close:
+            pool.discard(connection)
+        else:
+            pool.release(key, connection)
+        return response.status
+
+
+def probe_url(pool, url, timeout):
+    """Probe a URL with HEAD, falling back to GET if HEAD is not supported.
+
+    The timeout covers the whole probe, including the GET fallback.
+
+    Returns:
+        int: The HTTP status code of the response.
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        status = request_status(pool, "HEAD", url, deadline)
+    except http.client.HTTPException as e:
+        # A malformed reply to HEAD is retried with GET, but a host that
+        # dropped or refused the connection is not contacted again.
+        if isinstance(e, ConnectionError):
+            raise
+        return request_status(pool, "GET", url, deadline)
+
+    if status in HEAD_FALLBACK_STATUSES:
+        return request_status(pool, "GET", url, deadline)
+    return status
+
+
+async def probe_urls(urls, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT):
+    """Probe URLs concurrently and yield results as they complete.
+
+    Args:
+        urls (list): The URLs to probe.
+        concurrency (int, optional): Maximum number of requests in flight.
+        timeout (float, optional): Timeout in seconds for probing each URL.
+
+    Yields:
+        tuple: A tuple containing (url, status, error). On success, error is
+        None; on failure, status is None.
+    """
+    loop = asyncio.get_running_loop()
+    pool = ConnectionPool()
+    semaphore = asyncio.Semaphore(concurrency)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    async def probe(url):
+        async with semaphore:
+            try:
+                status = await loop.run_in_executor(
+                    executor, probe_url, pool, normalize_url(url), timeout
+                )
+                return url, status, None
+            except socket.timeout:
+                return url, None, "timed out"
+            except Exception as e:
+                return url, None, str(e) or type(e).__name__
+
+    try:
+        for next_result in asyncio.as_completed([probe(url) for url in urls]):
+            yield await next_result
+    finally:
+        # Abort requests still in flight, e.g. after Ctrl-C, instead of
+        # waiting for each of them to reach its timeout.
+        pool.close()
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from probe import probe_urls
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Local stand-in server: /missing is 404, /no-head rejects HEAD, /slow stalls,
+    /trickle sends its response one byte every 0.3 seconds, /work takes a moment.
+
+    Counts accepted connections and the peak number of requests in flight.
+    """
+
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    connections = 0
+    in_flight = 0
+    peak_in_flight = 0
+
+    @classmethod
+    def reset_stats(cls):
+        with cls.lock:
+            cls.connections = 0
+            cls.in_flight = 0
+            cls.peak_in_flight = 0
+
+    def setup(self):
+        super().setup()
+        with StandInHandler.lock:
+            StandInHandler.connections += 1
+
+    def handle_one_request(self):
+        # Only count requests once their request line has arrived, so idle
+        # keep-alive connections waiting for the next request are not counted.
+        self.raw_requestline = self.rfile.readline(65537)
+        if not self.raw_requestline:
+            self.close_connection = True
+            return
+        with StandInHandler.lock:
+            StandInHandler.in_flight += 1
+            StandInHandler.peak_in_flight = max(
+                StandInHandler.peak_in_flight, StandInHandler.in_flight
+            )
+        try:
+            if not self.parse_request():
+                return
+            method = getattr(self, "do_" + self.command)
+            method()
+            self.wfile.flush()
+        finally:
+            with StandInHandler.lock:
+                StandInHandler.in_flight -= 1
+
+    def do_HEAD(self):
+        if self.path == "/no-head":
+            self.respond(405)
+        else:
+            self.do_GET()
+
+    def do_GET(self):
+        if self.path == "/trickle":
+            self.trickle()
+            return
+        if self.path == "/slow":
+            time.sleep(2)
+        elif self.path.startswith("/work"):
+            time.sleep(0.01)
+        self.respond(404 if self.path == "/missing" else 200)
+
+    def respond(self, status):
+        body = b"" if self.command == "HEAD" else b"ok"
+        try:
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            # The client gave up waiting, e.g. after a timeout.
+            self.close_connection = True
+
+    def trickle(self):
+        self.close_connection = True
+        try:
+            for byte in b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n":
+                self.wfile.write(bytes([byte]))
+                self.wfile.flush()
+                time.sleep(0.3)
+        except OSError:
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def collect(urls, concurrency, timeout):
+    results = {}
+    async for url, status, error in probe_urls(urls, concurrency, timeout):
+        results[url] = status if error is None else error
+    return results
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+server.daemon_threads = True
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base_url = f"http://127.0.0.1:{server.server_address[1]}"
+print(f"Stand-in server running at {base_url}")
+
+try:
+    print("\nChecking status codes and HEAD-then-GET fallback...")
+    results = asyncio.run(
+        collect(
+            [f"{base_url}/", f"{base_url}/missing", f"{base_url}/no-head"],
+            concurrency=3,
+            timeout=5,
+        )
+    )
+    print(results)
+    assert results[f"{base_url}/"] == 200
+    assert results[f"{base_url}/missing"] == 404
+    assert results[f"{base_url}/no-head"] == 200
+
+    print("\nChecking timeout...")
+    results = asyncio.run(collect([f"{base_url}/slow"], concurrency=1, timeout=0.5))
+    print(results)
+    assert results[f"{base_url}/slow"] == "timed out"
+
+    print("\nChecking timeout against a server trickling its response...")
+    start_time = time.time()
+    results = asyncio.run(collect([f"{base_url}/trickle"], concurrency=1, timeout=1))
+    elapsed = time.time() - start_time
+    print(f"{results} after {elapsed:.2f} seconds")
+    assert results[f"{base_url}/trickle"] == "timed out"
+    assert elapsed < 2
+
+    print("\nChecking that cancelling aborts requests in flight...")
+    start_time = time.time()
+    try:
+        asyncio.run(
+            asyncio.wait_for(
+                collect([f"{base_url}/slow"] * 3, concurrency=3, timeout=10),
+                timeout=0.2,
+            )
+        )
+    except asyncio.TimeoutError:
+        pass
+    elapsed = time.time() - start_time
+    print(f"Cancelled after {elapsed:.2f} seconds")
+    assert elapsed < 1
+
+    print("\nChecking concurrency limit...")
+    StandInHandler.reset_stats()
+    urls = [f"{base_url}/work?n={i}" for i in range(100)]
+    results = asyncio.run(collect(urls, concurrency=5, timeout=5))
+    print(f"Peak requests in flight: {StandInHandler.peak_in_flight}")
+    assert all(status == 200 for status in results.values())
+    assert 1 < StandInHandler.peak_in_flight <= 5
+
+    print("\nMeasuring throughput...")
+    StandInHandler.reset_stats()
+    urls = [f"{base_url}/?n={i}" for i in range(500)]
+    start_time = time.time()
+    results = asyncio.run(collect(urls, concurrency=20, timeout=5))
+    elapsed = time.time() - start_time
+    assert len(results) == len(urls)
+    assert all(status == 200 for status in results.values())
+    print(f"Opened {StandInHandler.connections} connections for {len(urls)} URLs")
+    # Keep-alive connections are pooled per host, so at most one connection
+    # per concurrent request should ever be opened.
+    assert StandInHandler.connections <= 20
+    print(f"Probed {len(urls)} URLs in {elapsed:.2f} seconds")
+    print(f"Throughput: {len(urls) / elapsed:.0f} requests/second")
+finally:
+    server.shutdown()
+
+print("Test completed successfully!")